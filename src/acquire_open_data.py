@@ -1,6 +1,3 @@
-from clean_transform import (
-    detect_metadata_rows,
-)  # función para detectar filas de metadatos en un CSV
 from utils.io_utils import (
     download_file,
     extract_from_zip,
@@ -13,7 +10,7 @@ import os
 def acquire_dataset(url: str, dest_dir: str, prefix: str) -> str:
     """
     Downloads a ZIP from `url`, extracts CSV files (excluding Metadata),
-    stores them in `dest_dir`, and returns the path of the main CSV.
+    stores the main one in `dest_dir` as `{prefix}.csv` and returns its path.
     """
     os.makedirs(
         dest_dir, exist_ok=True
@@ -37,11 +34,10 @@ def acquire_dataset(url: str, dest_dir: str, prefix: str) -> str:
     fixed_csv = os.path.join(dest_dir, f"{prefix}.csv")
     os.rename(main_csv, fixed_csv)
 
-    # Detect and read metadata rows from the CSV
-    skiprows = detect_metadata_rows(fixed_csv)
-    read_csv_metadata(fixed_csv, skiprows=skiprows, source_name=prefix)
+    # Sniff the CSV layout once and record it alongside the provenance
+    read_csv_metadata(fixed_csv, source_name=prefix)
 
-    return main_csv  # return the original extracted CSV path
+    return fixed_csv  # return the renamed CSV path
 
 
 if __name__ == "__main__":
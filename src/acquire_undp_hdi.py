@@ -1,22 +1,27 @@
 import os
-import requests
-import pandas as pd
-from dotenv import load_dotenv
 
-# Load environment variables from .env file
-load_dotenv()
-
-# HDRO API key from environment
-HDRO_API_KEY = os.getenv("HDRO_API_KEY")
 BASE_URL = "https://hdrdata.org/api/CompositeIndices/query"
 
 
+def get_api_key():
+    """
+    Return the HDRO API key from the environment.
+    The .env file is only loaded here, when the API is actually used.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    return os.getenv("HDRO_API_KEY")
+
+
 def get_countries():
     """
     Fetch list of country codes from the UNDP HDRO API.
     Returns a list of ISO3 country codes.
     """
-    url = f"https://hdrdata.org/api/Metadata/Countries?apikey={HDRO_API_KEY}"
+    import requests
+
+    url = f"https://hdrdata.org/api/Metadata/Countries?apikey={get_api_key()}"
     response = requests.get(url)
     response.raise_for_status()
     countries = [c["code"] for c in response.json()]
@@ -29,7 +34,9 @@ def get_hdi_indicator_code():
     Searches for the indicator containing 'Human Development Index'.
     Raises ValueError if not found.
     """
-    url = f"https://hdrdata.org/api/Metadata/Indicators?apikey={HDRO_API_KEY}"
+    import requests
+
+    url = f"https://hdrdata.org/api/Metadata/Indicators?apikey={get_api_key()}"
     response = requests.get(url)
     response.raise_for_status()
     indicators = response.json()
@@ -56,10 +63,14 @@ def acquire_undp_hdi(
     - Downloads data in batches to avoid API limits.
     - Saves the combined dataset as a CSV in `dest_dir` with filename `{prefix}.csv`.
     """
+    import requests
+    import pandas as pd
+
     os.makedirs(dest_dir, exist_ok=True)  # ensure destination folder exists
 
     countries = get_countries()  # fetch country codes
     indicator_code = get_hdi_indicator_code()  # fetch HDI indicator code
+    api_key = get_api_key()
 
     all_data = []
     batch_size = 20  # number of countries per API request
@@ -68,7 +79,7 @@ def acquire_undp_hdi(
     for i in range(0, len(countries), batch_size):
         batch_countries = countries[i : i + batch_size]
         params = {
-            "apikey": HDRO_API_KEY,
+            "apikey": api_key,
             "countryOrAggregation": ",".join(batch_countries),
             "year": years,
             "indicator": indicator_code,
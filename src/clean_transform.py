@@ -1,42 +1,40 @@
-import pandas as pd
 import os
 import sys
-from resource_cleaners import (
-    cleaners,
-)  # dictionary of resource-specific cleaning functions
+from typing import TYPE_CHECKING
 
+from utils.reader_utils import get_reader_descriptor, read_csv_kwargs
 
-def detect_metadata_rows(
-    csv_path: str, keyword: str = "Country", max_rows: int = 20
-) -> int:
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# Default number of raw rows per batch in chunked mode
+DEFAULT_CHUNKSIZE = 50_000
+
+OUTPUT_FORMATS = ("csv", "parquet")
+
+
+def _output_path(csv_path: str, output_dir: str, output_format: str) -> str:
     """
-    Detect the number of initial metadata rows to skip in a CSV.
-    Scans the first `max_rows` rows for a line containing `keyword`.
+    Build the path of the long-format output for `csv_path`.
     """
-    with open(csv_path, "r", encoding="utf-8") as f:
-        for i in range(max_rows):
-            if keyword in f.readline():
-                return i
-    return 0
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unsupported output format: {output_format}")
+    return os.path.join(
+        output_dir,
+        os.path.basename(csv_path).replace(".csv", f"_long.{output_format}"),
+    )
 
 
-def clean_and_transform(
-    csv_path: str,
-    output_dir: str = "data/processed",
-    resource_name: str = None,
-    pivot=False,
-) -> pd.DataFrame:
+def _clean_frame(df: "pd.DataFrame", resource_name: str = None) -> "pd.DataFrame":
     """
-    Clean and transform a dataset to long format.
-    Applies resource-specific cleaning if available.
+    Clean column names, drop unnamed columns and apply the
+    resource-specific cleaner if available.
     """
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Detect and skip metadata rows
-    skiprows = detect_metadata_rows(csv_path)
+    from resource_cleaners import (
+        cleaners,
+    )  # dictionary of resource-specific cleaning functions
 
-    # Load CSV, clean column names, drop unnamed columns
-    df = pd.read_csv(csv_path, skiprows=skiprows, engine="python", on_bad_lines="skip")
     df.columns = [
         col.strip() if col.strip() != "" else f"column_{i}"
         for i, col in enumerate(df.columns)
@@ -47,16 +45,156 @@ def clean_and_transform(
     if resource_name in cleaners:
         df = cleaners[resource_name](df)
 
-    # Save cleaned DataFrame
-    output_path = os.path.join(
-        output_dir, os.path.basename(csv_path).replace(".csv", "_long.csv")
+    return df
+
+
+def clean_and_transform(
+    csv_path: str,
+    output_dir: str = "data/processed",
+    resource_name: str = None,
+    pivot=False,
+    output_format: str = "csv",
+) -> "pd.DataFrame":
+    """
+    Clean and transform a dataset to long format.
+    Applies resource-specific cleaning if available.
+    """
+    # Heavy imports are deferred so importing this module stays cheap
+    import pandas as pd
+
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = _output_path(csv_path, output_dir, output_format)
+
+    # Reuse the reader descriptor recorded at acquisition time
+    reader = get_reader_descriptor(csv_path)
+
+    # Load and clean CSV
+    df = pd.read_csv(
+        csv_path, **read_csv_kwargs(reader), engine="python", on_bad_lines="skip"
     )
-    df.to_csv(output_path, index=False)
-    print(f"Processed CSV saved to: {output_path}")
+    df = _clean_frame(df, resource_name)
+
+    # Save cleaned DataFrame
+    if output_format == "parquet":
+        df.to_parquet(output_path, index=False)
+    else:
+        df.to_csv(output_path, index=False)
+    print(f"Processed {output_format.upper()} saved to: {output_path}")
 
     return df
 
 
+def clean_and_transform_chunked(
+    csv_path: str,
+    output_dir: str = "data/processed",
+    resource_name: str = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    output_format: str = "csv",
+) -> str:
+    """
+    Out-of-core variant of `clean_and_transform` for large bulk extracts.
+
+    Reads the raw CSV in batches of `chunksize` rows, runs each batch
+    through the same cleaning logic and appends the long output to disk,
+    so peak memory is bounded by the batch size rather than the file size.
+    Cleaners emit rows in input order with fixed output dtypes, so the
+    output matches the in-memory path. A resource cleaner is therefore
+    required. An input without data rows still produces an (empty)
+    output with the cleaner's columns. Returns the output path.
+    """
+    import pandas as pd
+    from resource_cleaners import cleaners
+
+    if resource_name not in cleaners:
+        raise ValueError(
+            f"Chunked mode requires a resource cleaner, got: {resource_name}. "
+            f"Available: {', '.join(cleaners)}"
+        )
+
+    os.makedirs(output_dir, exist_ok=True)
+    output_path = _output_path(csv_path, output_dir, output_format)
+    reader = get_reader_descriptor(csv_path)
+
+    # Drop any previous output so an input without batches cannot leave it behind
+    if os.path.exists(output_path):
+        os.remove(output_path)
+
+    batches = pd.read_csv(
+        csv_path,
+        **read_csv_kwargs(reader),
+        engine="python",
+        on_bad_lines="skip",
+        chunksize=chunksize,
+    )
+    cleaned_batches = (_clean_frame(batch, resource_name) for batch in batches)
+
+    if output_format == "parquet":
+        _write_parquet_batches(cleaned_batches, output_path)
+    else:
+        for i, batch in enumerate(cleaned_batches):
+            batch.to_csv(
+                output_path, mode="w" if i == 0 else "a", header=i == 0, index=False
+            )
+
+    # No rows written: emit the cleaner's columns from a header-only read
+    if not os.path.exists(output_path):
+        empty = pd.read_csv(
+            csv_path,
+            **read_csv_kwargs(reader),
+            engine="python",
+            on_bad_lines="skip",
+            nrows=0,
+        )
+        empty = _clean_frame(empty, resource_name)
+        if output_format == "parquet":
+            empty.to_parquet(output_path, index=False)
+        else:
+            empty.to_csv(output_path, index=False)
+    print(f"Processed {output_format.upper()} saved to: {output_path}")
+
+    return output_path
+
+
+def _write_parquet_batches(batches, output_path: str):
+    """
+    Append cleaned batches to a single Parquet file.
+
+    The schema is fixed by the first non-empty batch; columns that are
+    entirely missing there (arrow 'null') are widened to string, and later
+    batches are converted against that schema. Empty batches are skipped,
+    since their column types cannot be inferred reliably; nothing is
+    written when every batch is empty.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    writer = None
+    schema = None
+    try:
+        for batch in batches:
+            if batch.empty:
+                continue
+            if schema is None:
+                inferred = pa.Schema.from_pandas(batch, preserve_index=False)
+                schema = pa.schema(
+                    [
+                        (
+                            field.with_type(pa.string())
+                            if pa.types.is_null(field.type)
+                            else field
+                        )
+                        for field in inferred
+                    ],
+                    metadata=inferred.metadata,
+                )
+                writer = pq.ParquetWriter(output_path, schema)
+            table = pa.Table.from_pandas(batch, schema=schema, preserve_index=False)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
 if __name__ == "__main__":
     # Parse command-line arguments
     csv_path = sys.argv[1]
@@ -1,24 +1,6 @@
-import pandas as pd
 import os
 import sys
-
-
-def detect_metadata_rows(
-    csv_path: str, max_rows: int = 20, keyword: str = "Country Name"
-) -> int:
-    """
-    Detects the number of metadata rows to skip in a CSV file.
-
-    Scans the top `max_rows` lines of the file until a line containing
-    the `keyword` (default: "Country Name") is found, which is assumed
-    to indicate the start of the actual dataset header.
-    """
-    with open(csv_path, "r", encoding="utf-8") as f:
-        for i in range(max_rows):
-            line = f.readline()
-            if keyword in line:
-                return i
-    return 0
+from utils.reader_utils import get_reader_descriptor, read_csv_kwargs
 
 
 def assess_data_quality(csv_path: str, output_dir: str = "data/quality") -> dict:
@@ -26,20 +8,24 @@ def assess_data_quality(csv_path: str, output_dir: str = "data/quality") -> dict
     Assess the data quality of a CSV file and generate a summary report.
 
     Performs the following steps:
-    - Detects and skips metadata/header rows.
+    - Reuses the reader descriptor to skip metadata/header rows.
     - Reads the dataset into a DataFrame.
     - Cleans column names and drops unnamed columns.
     - Converts numeric-like columns to numeric dtype.
     - Calculates key quality metrics (missing values, duplicates, etc.).
     - Saves a plain text report with summary statistics.
     """
+    import pandas as pd  # only needed once a report is actually built
+
     os.makedirs(output_dir, exist_ok=True)
 
-    # Detect header location
-    skiprows = detect_metadata_rows(csv_path)
+    # Reuse the reader descriptor recorded at acquisition time
+    reader = get_reader_descriptor(csv_path)
 
     # Load dataset, cleaning up column names
-    df = pd.read_csv(csv_path, skiprows=skiprows, engine="python", on_bad_lines="skip")
+    df = pd.read_csv(
+        csv_path, **read_csv_kwargs(reader), engine="python", on_bad_lines="skip"
+    )
     df.columns = [
         col.strip() if col.strip() != "" else f"column_{i}"
         for i, col in enumerate(df.columns)
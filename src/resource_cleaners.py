@@ -32,7 +32,7 @@ def clean_undp_hdi(df: pd.DataFrame) -> pd.DataFrame:
 
     # Convert to proper types
     df["year"] = df["year"].astype(int)
-    df["value"] = pd.to_numeric(df["value"], errors="coerce")
+    df["value"] = pd.to_numeric(df["value"], errors="coerce").astype("float64")
 
     # Filter countries and years
     df = df[
@@ -44,36 +44,49 @@ def clean_undp_hdi(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def clean_worldbank_dataset(df: pd.DataFrame, indicator_name) -> pd.DataFrame:
+def clean_worldbank_dataset(df: pd.DataFrame, indicator_name=None) -> pd.DataFrame:
     """
     Generic cleaner for World Bank datasets.
 
     Steps:
-    - Keep only the 'Country Code' and year columns
-    - Melt wide format (years as columns) into long format (one value per row)
-    - Insert an 'indicator' column using the provided name
+    - Keep only the 'Country Code' and year columns (plus 'Indicator Code'
+      when no indicator name is given)
+    - Melt wide format (years as columns) into long format (one value per row),
+      keeping the rows of each country together
+    - Label rows with the provided indicator name, or with their own
+      'Indicator Code' for multi-indicator extracts
     - Convert columns to numeric where appropriate
     - Filter by countries and years using constants
     """
     # Identify year columns
     year_cols = [col for col in df.columns if col.isdigit()]
-    df = df[["Country Code"] + year_cols].copy()
-
-    # Rename and reshape
-    df = df.rename(columns={"Country Code": "country_code"})
+    id_cols = {"Country Code": "country_code"}
+    if indicator_name is None:
+        id_cols["Indicator Code"] = "indicator"
+    df = df[list(id_cols) + year_cols]
+
+    # Rename and reshape; row-major order lets row batches be cleaned
+    # independently and concatenated into the same output
+    df = df.rename(columns=id_cols)
     df_long = df.melt(
-        id_vars=["country_code"],
+        id_vars=list(id_cols.values()),
         value_vars=year_cols,
         var_name="year",
         value_name="value",
-    )
+        ignore_index=False,
+    ).sort_index(kind="stable")
 
     # Add indicator column before 'value'
-    df_long.insert(df_long.columns.get_loc("value"), "indicator", indicator_name)
+    if indicator_name is None:
+        df_long = df_long[["country_code", "year", "indicator", "value"]]
+    else:
+        df_long.insert(df_long.columns.get_loc("value"), "indicator", indicator_name)
 
     # Convert to numeric types
     df_long["year"] = pd.to_numeric(df_long["year"], errors="coerce").astype("Int64")
-    df_long["value"] = pd.to_numeric(df_long["value"], errors="coerce")
+    df_long["value"] = pd.to_numeric(df_long["value"], errors="coerce").astype(
+        "float64"
+    )
 
     # Filter countries and years
     df_long = df_long[
@@ -117,6 +130,14 @@ def clean_worldbank_gdp_per_capita_usd(df: pd.DataFrame) -> pd.DataFrame:
     return clean_worldbank_dataset(df, "gdp_per_capita_usd")
 
 
+def clean_worldbank_bulk(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cleaner for multi-indicator World Bank bulk extracts (e.g. the full WDI
+    dump), labelling each row with its 'Indicator Code'.
+    """
+    return clean_worldbank_dataset(df)
+
+
 def clean_who_treatment_outcomes(df: pd.DataFrame) -> pd.DataFrame:
     """
     Clean WHO tuberculosis treatment outcomes dataset.
@@ -126,7 +147,8 @@ def clean_who_treatment_outcomes(df: pd.DataFrame) -> pd.DataFrame:
     - Keep and rename only relevant treatment outcome columns
     - Apply standardized naming via TB_TREATMENT_OUTCOME_FIELD_RENAME_MAP
     - Filter by included countries and year range
-    - Reshape to long format with one indicator-value pair per row
+    - Reshape to long format with one indicator-value pair per row,
+      keeping the rows of each country-year together
     - Drop missing and zero values
     """
     # Ensure consistent country code column
@@ -141,7 +163,7 @@ def clean_who_treatment_outcomes(df: pd.DataFrame) -> pd.DataFrame:
         raise ValueError("No matching columns found between DataFrame and rename_map")
 
     cols_to_keep = ["country_code", "year"] + existing_rename_keys
-    df_clean = df[cols_to_keep].copy()
+    df_clean = df[cols_to_keep]
 
     # Apply renaming
     df_clean = df_clean.rename(columns=TB_TREATMENT_OUTCOME_FIELD_RENAME_MAP)
@@ -165,7 +187,14 @@ def clean_who_treatment_outcomes(df: pd.DataFrame) -> pd.DataFrame:
     id_vars = ["country_code", "year"]
     value_vars = [col for col in df_clean.columns if col not in id_vars]
     df_long = df_clean.melt(
-        id_vars=id_vars, value_vars=value_vars, var_name="indicator", value_name="value"
+        id_vars=id_vars,
+        value_vars=value_vars,
+        var_name="indicator",
+        value_name="value",
+        ignore_index=False,
+    ).sort_index(kind="stable")
+    df_long["value"] = pd.to_numeric(df_long["value"], errors="coerce").astype(
+        "float64"
     )
 
     # Drop missing or zero values
@@ -184,4 +213,5 @@ cleaners = {
     "who_treatment_outcomes": clean_who_treatment_outcomes,
     "worldbank_health_expenditure_gdp_percent": clean_worldbank_health_expenditure_gdp_percent,
     "worldbank_health_expenditure_usd": clean_worldbank_health_expenditure_usd,
+    "worldbank_bulk": clean_worldbank_bulk,
 }
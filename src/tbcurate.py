@@ -0,0 +1,148 @@
+"""
+Single command-line entry point for the TB data curation pipeline.
+
+Each subcommand imports the stage it runs only when invoked, so lightweight
+commands such as `hash` or `sniff` start without loading pandas or requests.
+
+Usage:
+    python src/tbcurate.py acquire URL DEST_DIR PREFIX
+    python src/tbcurate.py acquire-hdi [--dest-dir DIR] [--prefix PREFIX]
+    python src/tbcurate.py register CSV_PATH SOURCE_NAME
+    python src/tbcurate.py clean CSV_PATH [OUTPUT_DIR] [RESOURCE_NAME]
+        [--chunksize N] [--format {csv,parquet}]
+    python src/tbcurate.py quality CSV_PATH [OUTPUT_DIR]
+    python src/tbcurate.py sniff CSV_PATH
+    python src/tbcurate.py hash FILE_PATH
+"""
+
+import argparse
+import sys
+
+
+def cmd_acquire(args):
+    """Download a World Bank ZIP and register its main CSV."""
+    from acquire_open_data import acquire_dataset
+
+    csv_path = acquire_dataset(args.url, args.dest_dir, args.prefix)
+    print(f"Acquired dataset: {csv_path}")
+
+
+def cmd_acquire_hdi(args):
+    """Download the UNDP HDI dataset from the HDRO API."""
+    from acquire_undp_hdi import acquire_undp_hdi
+
+    acquire_undp_hdi(dest_dir=args.dest_dir, prefix=args.prefix)
+
+
+def cmd_register(args):
+    """Sniff a raw CSV and log its provenance and reader descriptor."""
+    from utils.io_utils import read_csv_metadata
+
+    read_csv_metadata(args.csv_path, source_name=args.source_name)
+
+
+def cmd_clean(args):
+    """Clean and transform a raw CSV to long format."""
+    from clean_transform import clean_and_transform, clean_and_transform_chunked
+
+    if args.chunksize:
+        clean_and_transform_chunked(
+            args.csv_path,
+            args.output_dir,
+            args.resource_name,
+            chunksize=args.chunksize,
+            output_format=args.format,
+        )
+    else:
+        clean_and_transform(
+            args.csv_path,
+            args.output_dir,
+            args.resource_name,
+            output_format=args.format,
+        )
+
+
+def cmd_quality(args):
+    """Generate a data quality report for a raw CSV."""
+    from quality_assessment import assess_data_quality
+
+    assess_data_quality(args.csv_path, args.output_dir)
+
+
+def cmd_sniff(args):
+    """Print the reader descriptor of a CSV as JSON."""
+    import json
+
+    from utils.reader_utils import get_reader_descriptor
+
+    print(json.dumps(get_reader_descriptor(args.csv_path), indent=2))
+
+
+def cmd_hash(args):
+    """Print the MD5 hash of a file."""
+    from utils.metadata_utils import hash_file
+
+    print(hash_file(args.file_path))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Build the argument parser with one subparser per pipeline command.
+    """
+    parser = argparse.ArgumentParser(
+        prog="tbcurate", description="TB data curation pipeline"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    p = subparsers.add_parser("acquire", help=cmd_acquire.__doc__)
+    p.add_argument("url")
+    p.add_argument("dest_dir")
+    p.add_argument("prefix")
+    p.set_defaults(func=cmd_acquire)
+
+    p = subparsers.add_parser("acquire-hdi", help=cmd_acquire_hdi.__doc__)
+    p.add_argument("--dest-dir", default="data/raw")
+    p.add_argument("--prefix", default="undp_hdi")
+    p.set_defaults(func=cmd_acquire_hdi)
+
+    p = subparsers.add_parser("register", help=cmd_register.__doc__)
+    p.add_argument("csv_path")
+    p.add_argument("source_name")
+    p.set_defaults(func=cmd_register)
+
+    p = subparsers.add_parser("clean", help=cmd_clean.__doc__)
+    p.add_argument("csv_path")
+    p.add_argument("output_dir", nargs="?", default="data/processed")
+    p.add_argument("resource_name", nargs="?", default=None)
+    p.add_argument(
+        "--chunksize",
+        type=int,
+        default=None,
+        help="process the raw CSV in batches of this many rows (out-of-core)",
+    )
+    p.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    p.set_defaults(func=cmd_clean)
+
+    p = subparsers.add_parser("quality", help=cmd_quality.__doc__)
+    p.add_argument("csv_path")
+    p.add_argument("output_dir", nargs="?", default="data/quality")
+    p.set_defaults(func=cmd_quality)
+
+    p = subparsers.add_parser("sniff", help=cmd_sniff.__doc__)
+    p.add_argument("csv_path")
+    p.set_defaults(func=cmd_sniff)
+
+    p = subparsers.add_parser("hash", help=cmd_hash.__doc__)
+    p.add_argument("file_path")
+    p.set_defaults(func=cmd_hash)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
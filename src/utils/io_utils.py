@@ -1,9 +1,8 @@
 import os
 import io
 import zipfile
-import requests
-import pandas as pd
 from .metadata_utils import hash_file, log_metadata
+from .reader_utils import read_csv_kwargs, sniff_csv
 
 
 def download_file(url: str, dest_dir: str = "data/raw", filename: str | None = None):
@@ -11,6 +10,8 @@ def download_file(url: str, dest_dir: str = "data/raw", filename: str | None = N
     Generic downloader for any file (CSV, ZIP, JSON, etc.).
     Returns the path to the saved file and the raw content.
     """
+    import requests
+
     os.makedirs(dest_dir, exist_ok=True)
     response = requests.get(url)
     response.raise_for_status()
@@ -61,13 +62,18 @@ def extract_from_zip(
     return extracted_files
 
 
-def read_csv_metadata(csv_path: str, skiprows: int = 0, source_name: str = "generic"):
+def read_csv_metadata(csv_path: str, source_name: str = "generic"):
     """
-    Reads a CSV file, counts rows, computes hash, and logs metadata.
+    Sniffs the CSV layout, reads the file, counts rows, computes hash,
+    and logs metadata together with the reader descriptor so later
+    stages can read the file without probing it again.
     """
-    df = pd.read_csv(csv_path, skiprows=skiprows)
+    import pandas as pd
+
+    reader = sniff_csv(csv_path)
+    df = pd.read_csv(csv_path, **read_csv_kwargs(reader))
     rows = len(df)
     file_hash = hash_file(csv_path)
-    log_metadata(source_name, csv_path, rows, file_hash)
+    log_metadata(source_name, csv_path, rows, file_hash, reader=reader)
     print(f"Registered: {os.path.basename(csv_path)} | Rows={rows}, Hash={file_hash}")
     return df, file_hash, rows
@@ -2,6 +2,7 @@ import hashlib
 import json
 import datetime
 import os
+import tempfile
 
 
 def hash_file(filepath: str):
@@ -11,9 +12,18 @@ def hash_file(filepath: str):
     return h.hexdigest()
 
 
-def log_metadata(source_name: str, file_path: str, rows: int, file_hash: str):
+METADATA_PATH = "docs/metadata.json"
+
+
+def log_metadata(
+    source_name: str,
+    file_path: str,
+    rows: int,
+    file_hash: str,
+    reader: dict | None = None,
+):
     os.makedirs("docs", exist_ok=True)
-    metadata_path = "docs/metadata.json"
+    metadata_path = METADATA_PATH
     entry = {
         "source": source_name,
         "file": os.path.basename(file_path),
@@ -21,11 +31,39 @@ def log_metadata(source_name: str, file_path: str, rows: int, file_hash: str):
         "hash": file_hash,
         "timestamp": datetime.datetime.utcnow().isoformat(),
     }
+    if reader is not None:
+        entry["reader"] = reader
     if os.path.exists(metadata_path):
         with open(metadata_path, "r") as f:
             data = json.load(f)
     else:
         data = []
     data.append(entry)
-    with open(metadata_path, "w") as f:
-        json.dump(data, f, indent=2)
+
+    # Write to a temp file and swap it in, so concurrent stages reading
+    # the provenance never see a partially written file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(metadata_path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+        os.chmod(tmp_path, 0o644)  # mkstemp creates files owner-only
+        os.replace(tmp_path, metadata_path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+
+
+def find_metadata_entry(file_name: str, metadata_path: str = METADATA_PATH):
+    """
+    Return the most recent provenance entry logged for `file_name`, or None.
+    An unreadable metadata file is treated as having no entry.
+    """
+    try:
+        with open(metadata_path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    for entry in reversed(data):
+        if entry.get("file") == file_name:
+            return entry
+    return None
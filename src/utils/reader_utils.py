@@ -0,0 +1,188 @@
+import codecs
+import csv
+import io
+import os
+from collections import Counter
+
+from .metadata_utils import find_metadata_entry
+
+# Number of bytes read from the start of a file when sniffing its layout
+SNIFF_WINDOW_BYTES = 64 * 1024
+
+# Number of data rows of the dominant width that must follow the header
+HEADER_RUN_ROWS = 5
+
+# Delimiters considered when sniffing the header line
+CANDIDATE_DELIMITERS = ",;\t|"
+
+# Byte order marks and the encoding each one implies
+_BOMS = [
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+]
+
+# Cell values pandas parses as missing; they say nothing about a column's type
+_NA_VALUES = {"", "NA", "N/A", "n/a", "NaN", "nan", "-nan", "NULL", "null", "None"}
+
+
+def _detect_encoding(window: bytes) -> str:
+    """
+    Detect the encoding of a byte window.
+    Honours a leading BOM, otherwise tries UTF-8 and falls back to Latin-1.
+    """
+    for bom, encoding in _BOMS:
+        if window.startswith(bom):
+            return encoding
+    try:
+        # Incremental decoder tolerates a multi-byte character cut by the window
+        codecs.getincrementaldecoder("utf-8")().decode(window, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "latin-1"
+
+
+def _is_numeric(value: str) -> bool:
+    try:
+        float(value)
+        return True
+    except ValueError:
+        return False
+
+
+def _find_header(rows: list) -> int:
+    """
+    Return the index of the header among parsed (line, fields) rows.
+
+    The header is the first row of (roughly) the dominant field count that
+    is followed by a run of rows of exactly that width; one trailing empty
+    field is allowed on either the header or the data rows. Everything
+    before it is preamble (source, last updated, notes, ...).
+    """
+    width = Counter(len(row) for _, row in rows).most_common(1)[0][0]
+    data_trailing_empty = all(
+        row[-1].strip() == "" for _, row in rows if len(row) == width
+    )
+
+    def fits(row):
+        return (
+            len(row) == width
+            or (len(row) == width - 1 and data_trailing_empty)
+            or (len(row) == width + 1 and row[-1].strip() == "")
+        )
+
+    for i, (_, row) in enumerate(rows):
+        following = rows[i + 1 : i + 1 + HEADER_RUN_ROWS]
+        if fits(row) and following and all(len(r) == width for _, r in following):
+            return i
+
+    # Header-only or ragged windows: take the first row that fits at all
+    return next((i for i, (_, row) in enumerate(rows) if fits(row)), 0)
+
+
+def sniff_csv(csv_path: str, max_bytes: int = SNIFF_WINDOW_BYTES) -> dict:
+    """
+    Sniff the layout of a CSV file from its first `max_bytes` bytes.
+
+    Returns a reader descriptor with:
+    - 'encoding': detected encoding (BOM aware)
+    - 'delimiter': field separator
+    - 'skiprows': number of preamble lines before the header
+    - 'columns': header column names
+    - 'dtypes': text columns pinned to 'str' so pandas skips inferring them
+    - 'size', 'mtime': file size and modification time, used to detect
+      stale descriptors
+    """
+    stat = os.stat(csv_path)
+    with open(csv_path, "rb") as f:
+        window = f.read(max_bytes)
+        at_eof = not f.read(1)
+
+    encoding = _detect_encoding(window)
+    text = codecs.getincrementaldecoder(encoding)(errors="replace").decode(
+        window, final=at_eof
+    )
+
+    # Drop the trailing partial line when the window stops mid-file
+    if not at_eof and "\n" in text:
+        text = text[: text.rfind("\n") + 1]
+
+    lines = text.splitlines(keepends=True)
+    non_blank = [line for line in lines if line.strip()]
+    try:
+        dialect = csv.Sniffer().sniff(
+            "".join(non_blank[-20:]), delimiters=CANDIDATE_DELIMITERS
+        )
+        delimiter = dialect.delimiter
+    except csv.Error:
+        delimiter = ","
+
+    # Parse rows, remembering the physical line each one starts on
+    reader = csv.reader(io.StringIO(text), delimiter=delimiter)
+    rows = []
+    start_line = 0
+    for row in reader:
+        if any(cell.strip() for cell in row):
+            rows.append((start_line, row))
+        start_line = reader.line_num
+
+    if not rows:
+        return {
+            "encoding": encoding,
+            "delimiter": delimiter,
+            "skiprows": 0,
+            "columns": [],
+            "dtypes": {},
+            "size": stat.st_size,
+            "mtime": stat.st_mtime,
+        }
+
+    header_idx = _find_header(rows)
+    skiprows, columns = rows[header_idx]
+
+    # Pin columns holding non-numeric text in the window to 'str'
+    dtypes = {}
+    for _, row in rows[header_idx + 1 :]:
+        for col, value in zip(columns, row):
+            value = value.strip()
+            if col.strip() and value not in _NA_VALUES and not _is_numeric(value):
+                dtypes[col] = "str"
+
+    return {
+        "encoding": encoding,
+        "delimiter": delimiter,
+        "skiprows": skiprows,
+        "columns": columns,
+        "dtypes": {col: dtypes[col] for col in columns if col in dtypes},
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+    }
+
+
+def get_reader_descriptor(csv_path: str) -> dict:
+    """
+    Return the reader descriptor recorded for `csv_path` at acquisition time.
+    Falls back to sniffing the file when no up-to-date descriptor is recorded.
+    """
+    entry = find_metadata_entry(os.path.basename(csv_path))
+    reader = entry.get("reader") if entry else None
+    stat = os.stat(csv_path)
+    if (
+        reader
+        and reader.get("size") == stat.st_size
+        and reader.get("mtime") == stat.st_mtime
+    ):
+        return reader
+    return sniff_csv(csv_path)
+
+
+def read_csv_kwargs(reader: dict) -> dict:
+    """
+    Translate a reader descriptor into keyword arguments for `pd.read_csv`.
+    """
+    return {
+        "skiprows": reader["skiprows"],
+        "encoding": reader["encoding"],
+        "sep": reader["delimiter"],
+        "dtype": reader["dtypes"] or None,
+    }
@@ -0,0 +1,6 @@
+import os
+import sys
+
+# Stage scripts import each other as top-level modules from src/
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
@@ -0,0 +1,208 @@
+import os
+
+import pandas as pd
+import pytest
+
+from clean_transform import (
+    _write_parquet_batches,
+    clean_and_transform,
+    clean_and_transform_chunked,
+)
+from conftest import REPO_ROOT
+from resource_cleaners import cleaners
+from utils.reader_utils import sniff_csv
+
+RAW_DIR = os.path.join(REPO_ROOT, "data", "raw")
+
+# Resources without a raw file of their own are checked against a stand-in
+RAW_FILES = {"worldbank_bulk": "worldbank_population.csv"}
+
+# Small chunk sizes run on a sample of each raw file to keep the suite fast;
+# pandas has a fixed per-batch cost and the WHO/UNDP files have ~6k rows
+SAMPLE_CHUNKSIZES = [1, 7]
+FULL_CHUNKSIZE = 1000
+
+# Sampled rows: the first few, plus every row of these included countries
+SAMPLE_HEAD_ROWS = 40
+SAMPLE_COUNTRIES = ("ARG", "IND")
+
+
+def raw_path(resource_name):
+    return os.path.join(RAW_DIR, RAW_FILES.get(resource_name, f"{resource_name}.csv"))
+
+
+def write_sample(csv_path, output_dir):
+    """
+    Copy the preamble, header and a subset of data rows of `csv_path`.
+    """
+    header_line = sniff_csv(csv_path)["skiprows"]
+    sample_path = os.path.join(output_dir, os.path.basename(csv_path))
+    with open(csv_path, "rb") as src, open(sample_path, "wb") as tgt:
+        for i, line in enumerate(src):
+            data_row = i - header_line
+            if data_row <= SAMPLE_HEAD_ROWS or any(
+                code.encode() in line for code in SAMPLE_COUNTRIES
+            ):
+                tgt.write(line)
+    return sample_path
+
+
+def read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def in_memory_outputs(csv_path, resource_name, output_dir):
+    clean_and_transform(csv_path, output_dir, resource_name)
+    clean_and_transform(csv_path, output_dir, resource_name, output_format="parquet")
+    stem = os.path.basename(csv_path).replace(".csv", "_long")
+    return (
+        os.path.join(output_dir, f"{stem}.csv"),
+        os.path.join(output_dir, f"{stem}.parquet"),
+    )
+
+
+def assert_chunked_matches(csv_path, resource_name, chunksize, expected, output_dir):
+    expected_csv, expected_parquet = expected
+    chunked_csv = clean_and_transform_chunked(
+        csv_path, output_dir, resource_name, chunksize=chunksize
+    )
+    chunked_parquet = clean_and_transform_chunked(
+        csv_path,
+        output_dir,
+        resource_name,
+        chunksize=chunksize,
+        output_format="parquet",
+    )
+
+    assert read_bytes(chunked_csv) == read_bytes(expected_csv)
+    pd.testing.assert_frame_equal(
+        pd.read_parquet(chunked_parquet), pd.read_parquet(expected_parquet)
+    )
+
+
+@pytest.fixture(scope="module", params=sorted(cleaners))
+def sampled_resource(request, tmp_path_factory):
+    """A sampled raw file and its in-memory outputs for each cleaner."""
+    sample_dir = str(tmp_path_factory.mktemp(f"{request.param}_sample"))
+    csv_path = write_sample(raw_path(request.param), sample_dir)
+    output_dir = os.path.join(sample_dir, "in_memory")
+    return (
+        request.param,
+        csv_path,
+        in_memory_outputs(csv_path, request.param, output_dir),
+    )
+
+
+@pytest.mark.parametrize("chunksize", SAMPLE_CHUNKSIZES)
+def test_chunked_output_matches_in_memory(sampled_resource, chunksize, tmp_path):
+    resource_name, csv_path, expected = sampled_resource
+    assert len(pd.read_csv(expected[0])) > 0
+    assert_chunked_matches(csv_path, resource_name, chunksize, expected, str(tmp_path))
+
+
+@pytest.mark.parametrize("resource_name", sorted(cleaners))
+def test_chunked_full_raw_file_matches_in_memory(resource_name, tmp_path):
+    csv_path = raw_path(resource_name)
+    expected = in_memory_outputs(csv_path, resource_name, str(tmp_path / "in_memory"))
+    assert_chunked_matches(
+        csv_path, resource_name, FULL_CHUNKSIZE, expected, str(tmp_path / "chunked")
+    )
+
+
+def test_chunked_handles_dtypes_changing_between_batches(tmp_path):
+    # First batch: integral values only; second: all missing; third: floats
+    header = (
+        '"Country Name","Country Code","Indicator Name","Indicator Code",'
+        '"2015","2016"\n'
+    )
+    rows = [
+        '"Argentina","ARG","Population, total","SP.POP.TOTL","1","2"\n',
+        '"Brazil","BRA","Population, total","SP.POP.TOTL","3","4"\n',
+        '"Canada","CAN","Population, total","SP.POP.TOTL","",""\n',
+        '"France","FRA","Population, total","SP.POP.TOTL","",""\n',
+        '"India","IND","Population, total","SP.POP.TOTL","5.5","6.25"\n',
+    ]
+    csv_path = tmp_path / "worldbank_tb_incidence.csv"
+    csv_path.write_text(header + "".join(rows))
+    csv_path = str(csv_path)
+
+    for resource_name in ["worldbank_tb_incidence", "worldbank_bulk"]:
+        expected = in_memory_outputs(
+            csv_path, resource_name, str(tmp_path / f"{resource_name}_in_memory")
+        )
+        assert_chunked_matches(
+            csv_path, resource_name, 2, expected, str(tmp_path / resource_name)
+        )
+
+
+def test_parquet_writer_widens_all_missing_first_batch(tmp_path):
+    batches = [
+        pd.DataFrame({"country_code": [None, None], "value": [1.0, 2.0]}),
+        pd.DataFrame({"country_code": ["ARG"], "value": [3.5]}),
+    ]
+    output_path = str(tmp_path / "out.parquet")
+    _write_parquet_batches(iter(batches), output_path)
+
+    df = pd.read_parquet(output_path)
+    assert df["country_code"].tolist()[2] == "ARG"
+    assert df["value"].tolist() == [1.0, 2.0, 3.5]
+
+
+def test_chunked_requires_cleaner(tmp_path):
+    csv_path = tmp_path / "plain.csv"
+    csv_path.write_text("a,b\n1,x\n2,y\n3.5,z\n")
+
+    with pytest.raises(ValueError, match="requires a resource cleaner"):
+        clean_and_transform_chunked(str(csv_path), str(tmp_path), chunksize=2)
+
+
+def test_worldbank_bulk_keys_on_indicator_code():
+    df = pd.DataFrame(
+        {
+            "Country Name": ["Argentina", "Argentina"],
+            "Country Code": ["ARG", "ARG"],
+            "Indicator Name": ["Population, total", "GDP per capita"],
+            "Indicator Code": ["SP.POP.TOTL", "NY.GDP.PCAP.CD"],
+            "2015": [43.0, 13.5],
+            "2016": [44.0, 12.5],
+        }
+    )
+    df_long = cleaners["worldbank_bulk"](df)
+
+    assert list(df_long.columns) == ["country_code", "year", "indicator", "value"]
+    assert df_long["indicator"].tolist() == [
+        "SP.POP.TOTL",
+        "SP.POP.TOTL",
+        "NY.GDP.PCAP.CD",
+        "NY.GDP.PCAP.CD",
+    ]
+    assert df_long["value"].tolist() == [43.0, 44.0, 13.5, 12.5]
+
+
+@pytest.mark.parametrize("output_format", ["csv", "parquet"])
+@pytest.mark.parametrize(
+    "data_rows", [[], ['"Aruba","ABW","Population","SP.POP","1"\n']]
+)
+def test_chunked_without_output_rows_writes_empty_file(
+    tmp_path, output_format, data_rows
+):
+    # Header only, or a row the cleaner filters out (ABW is not included)
+    header = '"Country Name","Country Code","Indicator Name","Indicator Code","2015"\n'
+    csv_path = tmp_path / "raw" / "worldbank_tb_incidence.csv"
+    csv_path.parent.mkdir()
+    csv_path.write_text(header + "".join(data_rows))
+
+    output_path = clean_and_transform_chunked(
+        str(csv_path),
+        str(tmp_path),
+        "worldbank_tb_incidence",
+        chunksize=2,
+        output_format=output_format,
+    )
+
+    assert os.path.exists(output_path)
+    read = pd.read_parquet if output_format == "parquet" else pd.read_csv
+    df = read(output_path)
+    assert df.empty
+    assert list(df.columns) == ["country_code", "year", "indicator", "value"]
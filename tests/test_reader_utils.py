@@ -0,0 +1,138 @@
+import codecs
+import os
+
+from utils.io_utils import read_csv_metadata
+from utils.metadata_utils import find_metadata_entry, log_metadata
+from utils.reader_utils import get_reader_descriptor, sniff_csv
+
+WDI_CSV = (
+    '"Data Source","World Development Indicators",\n'
+    "\n"
+    '"Last Updated Date","2025-10-07",\n'
+    "\n"
+    '"Country Name","Country Code","Indicator Name","Indicator Code","2000","2001",\n'
+    '"Aruba","ABW","Population, total","SP.POP.TOTL","90588","91439",\n'
+    '"Afghanistan","AFG","Population, total","SP.POP.TOTL","19542982","19688632",\n'
+)
+
+
+def write(path, text, encoding="utf-8"):
+    with open(path, "wb") as f:
+        f.write(text.encode(encoding))
+    return str(path)
+
+
+def test_sniff_wdi_preamble_with_bom(tmp_path):
+    csv_path = write(tmp_path / "wdi.csv", codecs.BOM_UTF8.decode() + WDI_CSV)
+    reader = sniff_csv(csv_path)
+
+    assert reader["encoding"] == "utf-8-sig"
+    assert reader["delimiter"] == ","
+    assert reader["skiprows"] == 4
+    assert reader["columns"][:2] == ["Country Name", "Country Code"]
+    assert reader["dtypes"] == {
+        "Country Name": "str",
+        "Country Code": "str",
+        "Indicator Name": "str",
+        "Indicator Code": "str",
+    }
+
+
+def test_sniff_header_without_trailing_delimiter(tmp_path):
+    csv_path = write(tmp_path / "plain.csv", "a,b,c\n1,2,3,\n4,5,6,\n")
+    reader = sniff_csv(csv_path)
+
+    assert reader["skiprows"] == 0
+    assert reader["columns"] == ["a", "b", "c"]
+
+
+def test_sniff_plain_csv_without_preamble(tmp_path):
+    csv_path = write(tmp_path / "plain.csv", "country,year,value\nAFG,2000,1.5\n")
+    reader = sniff_csv(csv_path)
+
+    assert reader["skiprows"] == 0
+    assert reader["dtypes"] == {"country": "str"}
+
+
+def test_sniff_bounded_window(tmp_path):
+    rows = "".join(f"{i},{i * 2}\n" for i in range(10_000))
+    csv_path = write(tmp_path / "big.csv", "x,y\n" + rows)
+    reader = sniff_csv(csv_path, max_bytes=256)
+
+    assert reader["skiprows"] == 0
+    assert reader["columns"] == ["x", "y"]
+
+
+def test_descriptor_reused_until_file_changes(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    csv_path = write(tmp_path / "wdi.csv", WDI_CSV)
+    read_csv_metadata(csv_path, source_name="wdi")
+
+    recorded = get_reader_descriptor(csv_path)
+    assert recorded["skiprows"] == 4
+
+    # Same size, renamed column: the recorded descriptor must not be reused
+    write(tmp_path / "wdi.csv", WDI_CSV.replace("Country Name", "Country_Name"))
+    os.utime(csv_path, (recorded["mtime"] + 10, recorded["mtime"] + 10))
+    assert os.path.getsize(csv_path) == recorded["size"]
+    assert get_reader_descriptor(csv_path)["columns"][0] == "Country_Name"
+
+
+def test_sniff_narrow_table_after_preamble(tmp_path):
+    rows = "".join(f"C{i},X{i},{i}\n" for i in range(50))
+    csv_path = write(
+        tmp_path / "narrow.csv", "Source,World Bank\n\ncountry,code,value\n" + rows
+    )
+    reader = sniff_csv(csv_path)
+
+    assert reader["skiprows"] == 2
+    assert reader["columns"] == ["country", "code", "value"]
+
+
+def test_sniff_multi_line_preamble_of_growing_width(tmp_path):
+    rows = "".join(f"C{i},X{i},{i}\n" for i in range(50))
+    csv_path = write(
+        tmp_path / "notes.csv",
+        "Generated 2025-10-07\nNotes,see docs\n\ncountry,code,value\n" + rows,
+    )
+    reader = sniff_csv(csv_path)
+
+    assert reader["skiprows"] == 3
+    assert reader["columns"] == ["country", "code", "value"]
+
+
+def test_sniff_wdi_preamble_with_single_year_column(tmp_path):
+    rows = "".join(
+        f'"Country {i}","C{i:02d}","Population, total","SP.POP.TOTL","{i}",\n'
+        for i in range(20)
+    )
+    csv_path = write(
+        tmp_path / "wdi.csv",
+        '"Data Source","WDI",\n\n"Last Updated Date","2025-10-07",\n\n'
+        '"Country Name","Country Code","Indicator Name","Indicator Code","2000",\n'
+        + rows,
+    )
+    reader = sniff_csv(csv_path)
+
+    assert reader["skiprows"] == 4
+    assert reader["columns"][:2] == ["Country Name", "Country Code"]
+
+
+def test_descriptor_falls_back_when_metadata_unreadable(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    csv_path = write(tmp_path / "wdi.csv", WDI_CSV)
+    os.makedirs("docs")
+    with open(os.path.join("docs", "metadata.json"), "w") as f:
+        f.write('[{"source": "wdi", "file": "wdi.c')
+
+    assert find_metadata_entry("wdi.csv") is None
+    assert get_reader_descriptor(csv_path)["skiprows"] == 4
+
+
+def test_log_metadata_replaces_file_atomically(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    log_metadata("a", "a.csv", 1, "hash-a")
+    log_metadata("b", "b.csv", 2, "hash-b")
+
+    assert find_metadata_entry("b.csv")["hash"] == "hash-b"
+    assert os.listdir("docs") == ["metadata.json"]
@@ -0,0 +1,56 @@
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+from conftest import REPO_ROOT
+
+TBCURATE = os.path.join(REPO_ROOT, "src", "tbcurate.py")
+RAW_CSV = os.path.join(REPO_ROOT, "data", "raw", "worldbank_population.csv")
+
+# Modules the lightweight subcommands must never load
+HEAVY_MODULES = {"pandas", "numpy", "requests", "dotenv"}
+
+# Cold-start budget for imports beyond bare interpreter startup, in microseconds
+IMPORT_BUDGET_US = 50_000
+
+_IMPORTTIME_LINE = re.compile(r"import time:\s+\d+ \|\s+(\d+) \|( +)(\S+)")
+
+
+def importtime(*args):
+    """
+    Run `python -X importtime` and return {top-level module: cumulative us}
+    plus the set of every module imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=REPO_ROOT,
+    )
+    top_level, modules = {}, set()
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        cumulative, indent, name = match.groups()
+        modules.add(name.split(".")[0])
+        if len(indent) == 1:
+            top_level[name] = int(cumulative)
+    return top_level, modules
+
+
+@pytest.mark.parametrize(
+    "argv", [["hash", RAW_CSV], ["sniff", RAW_CSV], ["--help"]], ids=lambda a: a[0]
+)
+def test_lightweight_subcommand_import_budget(argv):
+    startup, _ = importtime("-c", "pass")
+    top_level, modules = importtime(TBCURATE, *argv)
+
+    assert not HEAVY_MODULES & modules
+
+    cost = sum(us for name, us in top_level.items() if name not in startup)
+    assert cost < IMPORT_BUDGET_US, f"{argv[0]} imports took {cost} us"